@@ -13,18 +13,46 @@
 import os
 import sys
 
-from importlib.metadata import version as get_version
+import sphinx.environment
 
 sys.path.insert(0, os.path.abspath(".."))
 
+# Sphinx unpickles a document's doctree from disk every time it is needed to
+# resolve a cross-reference, so heavily cross-referenced pages (such as the
+# autodoc-generated API pages) are unpickled many times per build. Cache the
+# parsed document per docname instead; doctrees do not change after the read
+# phase, so this is safe within a single build.
+_unpatched_get_doctree = sphinx.environment.BuildEnvironment.get_doctree
+
+
+def _cached_get_doctree(self, docname):
+    cache = getattr(self, "_pyro_doctree_cache", None)
+    if cache is None:
+        cache = self._pyro_doctree_cache = {}
+    if docname not in cache:
+        cache[docname] = _unpatched_get_doctree(self, docname)
+    return cache[docname]
+
+
+sphinx.environment.BuildEnvironment.get_doctree = _cached_get_doctree
+
 # -- Project information -----------------------------------------------------
 
 project = "pyrokinetics"
 copyright = "2021, Bhavin Patel"
 author = "Bhavin Patel"
 
-# The full version, including alpha/beta/rc tags
-release = get_version(project)
+# The full version, including alpha/beta/rc tags. Read from the version file
+# generated by setuptools_scm at build time, as this avoids a scan of the
+# installed package metadata on every Sphinx invocation. Fall back to
+# importlib.metadata when building docs from an installed wheel, where the
+# generated file may not be present.
+try:
+    from pyrokinetics._version import __version__ as release
+except ImportError:
+    from importlib.metadata import version as get_version
+
+    release = get_version(project)
 # Major.minor version
 version = ".".join(release.split(".")[:2])
 
@@ -54,6 +82,14 @@ exclude_patterns = ["_build", "Thumbs.db", ".DS_Store"]
 # Enable numbered references
 numfig = True
 
+# Skip the duplicate-label checking done by autosectionlabel, which scales
+# badly with the number of documents in the build.
+suppress_warnings = ["autosectionlabel.*"]
+
+# Only label down to top-level sections: the tutorials cross-reference those,
+# and labelling every subsection inflates the global label registry.
+autosectionlabel_maxdepth = 2
+
 autodoc_type_aliases = {
     "ArrayLike": "numpy.typing.ArrayLike",
 }
@@ -1,10 +1,13 @@
-from pyrokinetics import Pyro, template_dir
 import os
 import pathlib
 from typing import Union
 
 
 def main(base_path: Union[os.PathLike, str] = "."):
+    # Deferred so that importing/collecting this example doesn't load the
+    # full Pyro stack
+    from pyrokinetics import Pyro, template_dir
+
     # Equilibrium file
     eq_file = template_dir / "test.geqdsk"
 
@@ -4,6 +4,7 @@ Factory objects used throughout this project may inherit this class and add addi
 features, such as filetype inference.
 """
 
+from importlib import import_module
 from typing import Type
 from collections import UserDict
 
@@ -21,11 +22,24 @@ class Factory(UserDict):
     `my_type = my_factory[type_key]`
     Alternatively, they may be be created by calling the factory as a function:
     `my_type = my_factory(type_key, *args, **kwargs)`
+
+    Types may also be registered lazily by import path using `register_lazy`,
+    in which case the defining module is only imported the first time the key
+    is looked up.
     """
 
     def __init__(self, BaseClass: Type = object):
         super().__init__()
         self.BaseClass = BaseClass
+        self._lazy = {}
+
+    def register_lazy(self, key: str, module: str, attr: str) -> None:
+        """
+        Register the class `attr` from `module` under `key` without importing
+        the module. The import is deferred until the first lookup of `key`,
+        so registering many types does not slow down package import.
+        """
+        self._lazy[key] = (module, attr)
 
     def get_type(self, key: str):
         """
@@ -35,9 +49,27 @@ class Factory(UserDict):
         try:
             return self.data[key]
         except KeyError:
-            raise KeyError(
-                f"{self.__class__.__name__} has not registered the key {key}."
-            )
+            try:
+                module, attr = self._lazy[key]
+            except KeyError:
+                raise KeyError(
+                    f"{self.__class__.__name__} has not registered the key {key}."
+                ) from None
+            # Materialise the lazy registration. Goes via __setitem__ so that
+            # subclass checks (and any subclass hooks) are applied as usual.
+            self[key] = getattr(import_module(module), attr)
+            return self.data[key]
+
+    def __iter__(self):
+        yield from self.data
+        # Include lazily-registered keys that have not been materialised yet
+        yield from (key for key in self._lazy if key not in self.data)
+
+    def __len__(self):
+        return len(self.data.keys() | self._lazy.keys())
+
+    def __contains__(self, key):
+        return key in self.data or key in self._lazy
 
     def __getitem__(self, key: str):
         """Gets type, then instantiates with no args passed"""
@@ -1,7 +1,13 @@
-import numpy as np
+import copy
+import sys
+from functools import lru_cache
+from math import sqrt
+from operator import itemgetter
 from pathlib import Path
-from cleverdict import CleverDict
 from typing import Dict, Any, Optional
+
+import f90nml
+
 from ..typing import PathLike
 from ..constants import pi
 from ..local_species import LocalSpecies
@@ -18,6 +24,52 @@ from ..templates import gk_templates
 from .GKInput import GKInput
 
 
+# Directories already created by `write`, so repeated writes into the same
+# output directory (e.g. parameter scans) skip the stat+mkdir syscalls
+_created_dirs = set()
+
+# Units used on the hot read paths, resolved once: attribute access on the
+# registry parses the unit name every time
+_nref = ureg.nref_electron
+_tref = ureg.tref_electron
+_mref = ureg.mref_deuterium
+_qref = ureg.elementary_charge
+_nuref = ureg.vref_nrl / ureg.lref_minor_radius
+_beta_ref = ureg.beta_ref_ee_Bunit
+
+
+@lru_cache(maxsize=32)
+def _parse_tglf_input(input_string: str) -> Dict[str, Any]:
+    """Parse the contents of a TGLF input file to a dict.
+
+    TGLF input files are _almost_ Fortran namelists: comments use '#', so
+    tell f90nml to accept that token, wrap the text in namelist syntax, and
+    parse as usual. Cached, as parameter scans typically parse the same
+    template file many times over; callers must copy before mutating.
+    """
+    parser = f90nml.Parser()
+    parser.comment_tokens += "#"
+
+    # Strip off our fake namelist wrapper from the result. Keys are interned
+    # so the many instances produced by radial scans share one copy of each
+    # key string; deepcopy in read_str keeps the interned keys.
+    return {
+        sys.intern(key): value
+        for key, value in parser.reads(f"&nml\n{input_string}\n/").todict()["nml"].items()
+    }
+
+
+def _format_value(value, float_format: str = "") -> str:
+    """Format a single TGLF input value for writing"""
+    # isinstance rather than exact type checks: floats here may be numpy
+    # scalars, which subclass the builtin float
+    if isinstance(value, float):
+        return f"{value:{float_format}}"
+    if isinstance(value, bool):
+        return "T" if value else "F"
+    return str(value)
+
+
 class GKInputTGLF(GKInput):
     """Reader for TGLF input files"""
 
@@ -77,6 +129,23 @@ class GKInputTGLF(GKInput):
         "shift": 0.0,
     }
 
+    # Pre-paired (pyro_key, tglf_key), default tuples, so the geometry
+    # loaders don't rebuild the zip on every call
+    _miller_pairs = tuple(
+        zip(pyro_tglf_miller.items(), pyro_tglf_miller_defaults.values())
+    )
+    _mxh_pairs = tuple(zip(pyro_tglf_mxh.items(), pyro_tglf_mxh_defaults.values()))
+
+    # (getter, tglf_key) pairs used by `set`; the C-implemented itemgetter
+    # avoids a Python-level __getitem__ dispatch per key
+    _miller_setters = tuple(
+        (itemgetter(pyro_key), tglf_key)
+        for pyro_key, tglf_key in pyro_tglf_miller.items()
+    )
+    _mxh_setters = tuple(
+        (itemgetter(pyro_key), tglf_key) for pyro_key, tglf_key in pyro_tglf_mxh.items()
+    )
+
     @staticmethod
     def pyro_TGLF_species(iSp=1):
         return {
@@ -101,14 +170,9 @@ class GKInputTGLF(GKInput):
         """
         Reads TGLF input file given as string
         """
-        # TGLF input files are _almost_ Fortran namelists, so if we
-        # change the comments to use '!' instead of '#', and wrap it
-        # in a namelist syntax, we can just use the base `read_str`
-        as_namelist = f"&nml\n{input_string.replace('#', '!')}\n/"
-
-        # We need to strip off our fake namelist wrapper when we store
-        # it internally
-        self.data = super().read_str(as_namelist)["nml"]
+        # Deep copy the cached parse so that each instance owns its data and
+        # may mutate it freely
+        self.data = copy.deepcopy(_parse_tglf_input(input_string))
         return self.data
 
     def verify(self, filename: PathLike):
@@ -125,23 +189,46 @@ class GKInputTGLF(GKInput):
         """
         Write input file for TGLF
         """
-        Path(filename).parent.mkdir(parents=True, exist_ok=True)
+        parent = Path(filename).parent
+        if parent not in _created_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            _created_dirs.add(parent)
 
         if local_norm is None:
             local_norm = Normalisation("write")
 
-        self.data = convert_dict(self.data, local_norm.cgyro)
-
-        with open(filename, "w+") as new_TGLF_input:
-            for key, value in self.data.items():
-                if isinstance(value, float):
-                    value_str = f"{value:{float_format}}"
-                elif isinstance(value, bool):
-                    value_str = "T" if value else "F"
-                else:
-                    value_str = str(value)
-
-                new_TGLF_input.write(f"{key.upper()} = {value_str}\n")
+        # Convert in place: most entries are plain floats/ints untouched by
+        # conversion, so there is no need to rebuild the whole dict
+        convert_dict(self.data, local_norm.cgyro, in_place=True)
+
+        # Assemble the whole file as one string so we issue a single write,
+        # rather than one per key
+        lines = [
+            f"{key.upper()} = {_format_value(value, float_format)}"
+            for key, value in self.data.items()
+        ]
+        content = "\n".join(lines) + "\n"
+
+        # Skip the write if the file already holds this content, so repeated
+        # writes in scan workflows don't touch mtimes and bust downstream
+        # caches
+        try:
+            if Path(filename).read_text() == content:
+                return
+        except (OSError, UnicodeDecodeError):
+            pass
+
+        try:
+            with open(filename, "w+") as new_TGLF_input:
+                new_TGLF_input.write(content)
+        except FileNotFoundError:
+            # The cached directory has been removed since we created it;
+            # evict it from the cache and recreate before retrying
+            _created_dirs.discard(parent)
+            parent.mkdir(parents=True, exist_ok=True)
+            _created_dirs.add(parent)
+            with open(filename, "w+") as new_TGLF_input:
+                new_TGLF_input.write(content)
 
     def is_nonlinear(self) -> bool:
         return self.data.get("use_transport_model", 1) == 1
@@ -177,21 +264,18 @@ class GKInputTGLF(GKInput):
         """
         Load Miller object from TGLF file
         """
-
         miller_data = default_miller_inputs()
 
-        for (pyro_key, tglf_key), tglf_default in zip(
-            self.pyro_tglf_miller.items(), self.pyro_tglf_miller_defaults.values()
-        ):
-            miller_data[pyro_key] = self.data.get(tglf_key, tglf_default)
+        get = self.data.get
+        for (pyro_key, tglf_key), tglf_default in self._miller_pairs:
+            miller_data[pyro_key] = get(tglf_key, tglf_default)
 
-        miller_data["s_delta"] = self.data.get("s_delta_loc", 0.0) / np.sqrt(
+        # math.sqrt rather than np.sqrt: these are plain Python scalars
+        miller_data["s_delta"] = self.data.get("s_delta_loc", 0.0) / sqrt(
             1 - miller_data["delta"] ** 2
         )
-        miller_data["shat"] = (
-            self.data.get("q_prime_loc", 16.0)
-            * (miller_data["rho"] / miller_data["q"]) ** 2
-        )
+        rho_over_q = miller_data["rho"] / miller_data["q"]
+        miller_data["shat"] = self.data.get("q_prime_loc", 16.0) * rho_over_q**2
 
         # Must construct using from_gk_data as we cannot determine
         # bunit_over_b0 here. We also need it to set B0 and
@@ -206,10 +290,9 @@ class GKInputTGLF(GKInput):
         # need to get all the species data first?
         miller.beta_prime = (
             self.data.get("p_prime_loc", 0.0)
-            * miller_data["rho"]
-            / miller_data["q"]
+            * rho_over_q
             * miller.bunit_over_b0**2
-            * (8 * np.pi)
+            * (8 * pi)
         )
 
         return miller
@@ -218,17 +301,14 @@ class GKInputTGLF(GKInput):
         """
         Load mxh object from TGLF file
         """
-
         mxh_data = default_mxh_inputs()
 
-        for (pyro_key, tglf_key), tglf_default in zip(
-            self.pyro_tglf_mxh.items(), self.pyro_tglf_mxh_defaults.values()
-        ):
-            mxh_data[pyro_key] = self.data.get(tglf_key, tglf_default)
+        get = self.data.get
+        for (pyro_key, tglf_key), tglf_default in self._mxh_pairs:
+            mxh_data[pyro_key] = get(tglf_key, tglf_default)
 
-        mxh_data["shat"] = (
-            self.data.get("q_prime_loc", 16.0) * (mxh_data["rho"] / mxh_data["q"]) ** 2
-        )
+        rho_over_q = mxh_data["rho"] / mxh_data["q"]
+        mxh_data["shat"] = self.data.get("q_prime_loc", 16.0) * rho_over_q**2
 
         # Must construct using from_gk_data as we cannot determine
         # bunit_over_b0 here. We also need it to set B0 and
@@ -243,10 +323,9 @@ class GKInputTGLF(GKInput):
         # need to get all the species data first?
         mxh.beta_prime = (
             self.data.get("p_prime_loc", 0.0)
-            * mxh_data["rho"]
-            / mxh_data["q"]
+            * rho_over_q
             * mxh.bunit_over_b0**2
-            * (8 * np.pi)
+            * (8 * pi)
         )
 
         return mxh
@@ -255,65 +334,73 @@ class GKInputTGLF(GKInput):
         """
         Load LocalSpecies object from TGLF file
         """
+        import numpy as np
+
         # Dictionary of local species parameters
         local_species = LocalSpecies()
         local_species.names = []
 
         ion_count = 0
 
-        # Load each species into a dictionary
+        # Load each species into a plain dict; CleverDict machinery is only
+        # needed on the final stored species
+        pending = []
         for i_sp in range(self.data["ns"]):
             pyro_TGLF_species = self.pyro_TGLF_species(i_sp + 1)
-            species_data = CleverDict()
-            for p_key, c_key in pyro_TGLF_species.items():
-                species_data[p_key] = self.data[c_key]
+            species_data = {
+                p_key: self.data[c_key] for p_key, c_key in pyro_TGLF_species.items()
+            }
 
-            species_data.vel = 0.0
-            species_data.a_lv = 0.0
+            species_data["vel"] = 0.0
+            species_data["a_lv"] = 0.0
 
-            if species_data.z == -1:
+            if species_data["z"] == -1:
                 name = "electron"
-                species_data.nu = (
-                    self.data["xnue"] * ureg.vref_nrl / ureg.lref_minor_radius
-                )
+                species_data["nu"] = self.data["xnue"] * _nuref
             else:
                 ion_count += 1
                 name = f"ion{ion_count}"
 
-            species_data.name = name
+            species_data["name"] = name
 
             # normalisations
-            species_data.dens *= ureg.nref_electron
-            species_data.mass *= ureg.mref_deuterium
-            species_data.temp *= ureg.tref_electron
-            species_data.z *= ureg.elementary_charge
+            species_data["dens"] *= _nref
+            species_data["mass"] *= _mref
+            species_data["temp"] *= _tref
+            species_data["z"] *= _qref
 
-            # Add individual species data to dictionary of species
-            local_species.add_species(name=name, species_data=species_data)
+            pending.append((name, species_data))
 
-        # Get collision frequency of ion species
+        # Add all species in one go
+        local_species.add_species_bulk(pending)
+
+        # Get collision frequency of ion species. Work on plain magnitudes in
+        # a single vectorised expression, rather than on Pint quantities one
+        # ion at a time.
         nu_ee = local_species.electron.nu
-        te = local_species.electron.temp
-        ne = local_species.electron.dens
-        me = local_species.electron.mass
-
-        for ion in range(ion_count):
-            key = f"ion{ion + 1}"
-
-            nion = local_species[key]["dens"]
-            tion = local_species[key]["temp"]
-            mion = local_species[key]["mass"]
-            zion = local_species[key]["z"]
-            # Not exact at log(Lambda) does change but pretty close...
-            local_species[key]["nu"] = (
-                nu_ee
-                * (zion**4 * nion / tion**1.5 / mion**0.5)
-                / (ne / te**1.5 / me**0.5)
-            ).m * nu_ee.units
+        te = local_species.electron.temp.m
+        ne = local_species.electron.dens.m
+        me = local_species.electron.mass.m
+
+        ion_keys = [f"ion{ion + 1}" for ion in range(ion_count)]
+        nion = np.array([local_species[key]["dens"].m for key in ion_keys])
+        tion = np.array([local_species[key]["temp"].m for key in ion_keys])
+        mion = np.array([local_species[key]["mass"].m for key in ion_keys])
+        zion = np.array([local_species[key]["z"].m for key in ion_keys])
+
+        # Not exact at log(Lambda) does change but pretty close...
+        nu_ion = (
+            nu_ee.m
+            * (zion**4 * nion / tion**1.5 / mion**0.5)
+            / (ne / te**1.5 / me**0.5)
+        )
+
+        for ion, key in enumerate(ion_keys):
+            local_species[key]["nu"] = nu_ion[ion] * nu_ee.units
 
         local_species.normalise()
 
-        local_species.zeff = self.data.get("zeff", 1.0) * ureg.elementary_charge
+        local_species.zeff = self.data.get("zeff", 1.0) * _qref
 
         return local_species
 
@@ -333,7 +420,7 @@ class GKInputTGLF(GKInput):
         numerics_data["theta0"] = self.data.get("kx0_loc", 0.0) * 2 * pi
         numerics_data["ntheta"] = self.data.get("nxgrid", 16)
         numerics_data["nonlinear"] = self.is_nonlinear()
-        numerics_data["beta"] = self.data["betae"] * ureg.beta_ref_ee_Bunit
+        numerics_data["beta"] = self.data["betae"] * _beta_ref
 
         return Numerics(**numerics_data)
 
@@ -351,6 +438,8 @@ class GKInputTGLF(GKInput):
         These may be obtained via another GKInput file, or from Equilibrium/Kinetics
         objects.
         """
+        import numpy as np
+
         # If self.data is not already populated, fill in defaults from a given
         # template file. If this is not provided by the user, fall back to the
         # default.
@@ -375,8 +464,8 @@ class GKInputTGLF(GKInput):
 
         if eq_type == "Miller":
             # Assign Miller values to input file
-            for key, value in self.pyro_tglf_miller.items():
-                self.data[value] = local_geometry[key]
+            for getter, tglf_key in self._miller_setters:
+                self.data[tglf_key] = getter(local_geometry)
 
             self.data["s_delta_loc"] = local_geometry.s_delta * np.sqrt(
                 1 - local_geometry.delta**2
@@ -384,8 +473,8 @@ class GKInputTGLF(GKInput):
 
         elif eq_type == "MXH":
             # Assign MXH values to input file
-            for key, value in self.pyro_tglf_mxh.items():
-                self.data[value] = local_geometry[key]
+            for getter, tglf_key in self._mxh_setters:
+                self.data[tglf_key] = getter(local_geometry)
 
         self.data["q_prime_loc"] = (
             local_geometry.shat * (local_geometry.q / local_geometry.rho) ** 2
@@ -411,7 +500,7 @@ class GKInputTGLF(GKInput):
             * local_geometry.q
             / local_geometry.rho
             / local_geometry.bunit_over_b0**2
-            / (8 * np.pi)
+            / (8 * pi)
         )
 
         # Numerics
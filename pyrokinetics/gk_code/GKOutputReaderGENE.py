@@ -1,10 +1,10 @@
 import numpy as np
 import xarray as xr
-import f90nml
 import logging
+import os
 import struct
-import csv
 import re
+from functools import lru_cache
 import h5py
 from typing import Tuple, Dict, Any, Optional
 from pathlib import Path
@@ -14,6 +14,11 @@ from .GKInputGENE import GKInputGENE
 from ..constants import pi
 from ..typing import PathLike
 
+# Filenames of the form parameters_0001, field_0001, nrg_0001, omega_0001
+_gene_file_regex = re.compile(r"^(parameters|field|nrg|omega)_(\d{4})$")
+# Numbered part of a GENE run filename
+_num_part_regex = re.compile(r"(\d{4})")
+
 
 class GKOutputReaderGENE(GKOutputReader):
     fields = ["phi", "apar", "bpar"]
@@ -25,16 +30,36 @@ class GKOutputReaderGENE(GKOutputReader):
         filename/field_0000 and filename/nrg_0000.
         If instead given any of the files parameters_####, field_#### or nrg_####,
         looks up the rest of the files in the same directory.
+
+        Results are cached by resolved path: this is called both while
+        probing file types and again when reading, and GENE output
+        directories do not change under us.
         """
+        files = GKOutputReaderGENE._get_gene_files_cached(
+            str(Path(filename).resolve())
+        )
+        # Copy so cached entries can't be mutated through the returned dict
+        return dict(files)
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _get_gene_files_cached(filename: str) -> Dict[str, Path]:
         filename = Path(filename)
         prefixes = ["parameters", "field", "nrg", "omega"]
-        if filename.is_dir():
+        is_dir = filename.is_dir()
+        dirname = filename if is_dir else filename.parent
+
+        # Read the directory contents once; checking each candidate file
+        # individually costs a stat call per check
+        try:
+            with os.scandir(dirname) as dir_contents:
+                entries = {entry.name for entry in dir_contents if entry.is_file()}
+        except OSError:
+            entries = set()
+
+        if is_dir:
             # If given a dir name, looks for dir/parameters_0000
-            dirname = filename
-            dat_matches = np.all(
-                [Path(filename / f"{p}.dat").is_file() for p in prefixes]
-            )
-            if dat_matches:
+            if all(f"{p}.dat" in entries for p in prefixes):
                 suffix = "dat"
                 delimiter = "."
             else:
@@ -42,23 +67,22 @@ class GKOutputReaderGENE(GKOutputReader):
                 delimiter = "_"
         else:
             # If given a file, searches for all similar GENE files in that file's dir
-            dirname = filename.parent
-            # Ensure provided file is a GENE file (fr"..." means raw format str)
-            matches = [re.search(rf"^{p}_\d{{4}}$", filename.name) for p in prefixes]
-            if not np.any(matches):
+            # Ensure provided file is a GENE file
+            match = _gene_file_regex.match(filename.name)
+            if match is None:
                 raise RuntimeError(
                     f"GKOutputReaderGENE: The provided file {filename} is not a GENE "
                     "output file."
                 )
-            suffix = filename.name.split("_")[1]
+            suffix = match.group(2)
             delimiter = "_"
 
         # Get all files in the same dir
-        files = {
-            prefix: dirname / f"{prefix}{delimiter}{suffix}"
-            for prefix in prefixes
-            if (dirname / f"{prefix}{delimiter}{suffix}").exists()
-        }
+        files = {}
+        for prefix in prefixes:
+            name = f"{prefix}{delimiter}{suffix}"
+            if name in entries:
+                files[prefix] = dirname / name
 
         if not files:
             raise RuntimeError(
@@ -73,7 +97,7 @@ class GKOutputReaderGENE(GKOutputReader):
         # If binary field file absent, adds .h5 field file,
         # if present, to 'files'
         if "field" not in files:
-            if (dirname / f"field{delimiter}{suffix}.h5").exists():
+            if f"field{delimiter}{suffix}.h5" in entries:
                 files.update({"field": dirname / f"field{delimiter}{suffix}.h5"})
         return files
 
@@ -89,8 +113,7 @@ class GKOutputReaderGENE(GKOutputReader):
         # search for 'parameters_####' in the run directory. If not, simply return
         # the directory.
         filename = Path(filename)
-        num_part_regex = re.compile(r"(\d{4})")
-        num_part_match = num_part_regex.search(filename.name)
+        num_part_match = _num_part_regex.search(filename.name)
 
         if num_part_match is None:
             return Path(filename).parent
@@ -112,6 +135,25 @@ class GKOutputReaderGENE(GKOutputReader):
         # Simply return files in place of raw data
         return files, gk_input, input_str
 
+    @staticmethod
+    def _read_nrg_lasttime(nrg_file: PathLike, nspecies: int) -> float:
+        """
+        Returns the time of the final block in an nrg file, i.e. the value on
+        the (nspecies + 1)-th line from the end. Only the tail of the file is
+        read: for long runs the nrg file can be tens of MB, all of which
+        f.readlines() would otherwise load and split.
+        """
+        with open(nrg_file, "rb") as f:
+            size = f.seek(0, 2)
+            window = 8192
+            while True:
+                f.seek(max(0, size - window))
+                tail = f.read().decode().splitlines()
+                # Need one extra line in case the window starts mid-line
+                if len(tail) > nspecies + 1 or window >= size:
+                    return float(tail[-(nspecies + 1)])
+                window *= 2
+
     @classmethod
     def _init_dataset(
         cls, raw_data: Dict[str, Any], gk_input: GKInputGENE
@@ -136,8 +178,7 @@ class GKOutputReaderGENE(GKOutputReader):
         # The last time step is not always written, but depends on
         # whatever condition is met first between simtimelim and timelim
         species = gk_input.get_local_species().names
-        with open(raw_data["nrg"], "r") as f:
-            lasttime = float(f.readlines()[-(len(species) + 1)])
+        lasttime = cls._read_nrg_lasttime(raw_data["nrg"], len(species))
         if lasttime == nml["general"]["simtimelim"]:
             ntime = ntime + 1
 
@@ -163,17 +204,13 @@ class GKOutputReaderGENE(GKOutputReader):
         if gk_input.is_linear():
             # Set up ballooning angle
             single_theta_loop = theta
-            single_ntheta_loop = ntheta
 
             ntheta = ntheta * (nkx - 1)
-            theta = np.empty(ntheta)
-            start = 0
-            for i in range(nkx - 1):
-                pi_segment = i - nkx // 2 + 1
-                theta[start : start + single_ntheta_loop] = (
-                    single_theta_loop + pi_segment * 2 * pi
-                )
-                start += single_ntheta_loop
+            pi_segments = np.arange(nkx - 1) - nkx // 2 + 1
+            theta = (
+                single_theta_loop[np.newaxis, :]
+                + pi_segments[:, np.newaxis] * 2 * pi
+            ).ravel()
 
             ky = [nml["box"]["kymin"]]
             kx = [0.0]
@@ -185,12 +222,10 @@ class GKOutputReaderGENE(GKOutputReader):
             ky = np.linspace(0, kymin * (nky - 1), nky)
             lx = nml["box"]["lx"]
             dkx = 2 * np.pi / lx
-            kx = np.empty(nkx)
-            for i in range(nkx):
-                if i < (nkx / 2 + 1):
-                    kx[i] = i * dkx
-                else:
-                    kx[i] = (i - nkx) * dkx
+            # FFT-style kx grid, except the Nyquist mode stays positive for
+            # even nkx, so np.fft.fftfreq cannot be used directly
+            modes = np.arange(nkx)
+            kx = np.where(modes < (nkx / 2 + 1), modes, modes - nkx) * dkx
 
         # Store grid data as xarray DataSet
         return xr.Dataset(
@@ -250,96 +285,177 @@ class GKOutputReaderGENE(GKOutputReader):
 
         field_size = nx * nz * data.nky * complex_size
 
-        sliced_field = np.empty(
-            (data.nfield, nx, data.nky, nz, data.ntime), dtype=complex
-        )
-        fields = np.empty(
-            (data.nfield, data.nkx, data.nky, data.ntheta, data.ntime), dtype=complex
-        )
         # Read binary file if present
         if ".h5" not in str(raw_data["field"]):
-            with open(raw_data["field"], "rb") as file:
-                for i_time in range(data.ntime):
-                    # Read in time data (stored as int, double int)
-                    time_value = float(
-                        struct.unpack(time_data_fmt, file.read(time_data_size))[1]
-                    )
-                    time.append(time_value)
-                    for i_field in range(data.nfield):
-                        file.seek(int_size, 1)
-                        binary_field = file.read(field_size)
-                        raw_field = np.frombuffer(binary_field, dtype=np.complex128)
-                        sliced_field[i_field, :, :, :, i_time] = raw_field.reshape(
-                            (nx, data.nky, nz),
-                            order="F",
-                        )
-                        file.seek(int_size, 1)
-                    if i_time < data.ntime - 1:
-                        file.seek(
-                            (downsize - 1)
-                            * (
-                                time_data_size
-                                + data.nfield * (2 * int_size + field_size)
-                            ),
-                            1,
-                        )
+            # Each record holds the time data followed by every field, with
+            # each field block framed by Fortran 4-byte record markers. Read
+            # the whole file in one go and pull out the kept timesteps with
+            # strided views, rather than looping over many small reads.
+            record_stride = time_data_size + data.nfield * (2 * int_size + field_size)
+            kept_stride = downsize * record_stride
+            nrecords = (data.ntime - 1) * downsize + 1
+            buf = np.fromfile(
+                raw_data["field"], dtype=np.uint8, count=nrecords * record_stride
+            )
+            if buf.size < nrecords * record_stride:
+                raise RuntimeError(
+                    f"GKOutputReaderGENE: Field file '{raw_data['field']}' is "
+                    f"smaller than expected for {data.ntime} output times."
+                )
+
+            # Time data stored as binary (int, double, int) at the head of
+            # each record
+            time = (
+                np.lib.stride_tricks.as_strided(
+                    buf[int_size:], shape=(data.ntime, 8), strides=(kept_stride, 1)
+                )
+                .copy()
+                .view("=f8")
+                .ravel()
+            )
+
+            # Lay a complex view over the raw bytes: each block is
+            # Fortran-ordered over (nx, nky, nz), so the element strides below
+            # address it as (time, field, nz, nky, nx) without copying
+            data_offset = time_data_size + int_size
+            n_complex = (buf.size - data_offset) // complex_size
+            cbuf = buf[data_offset : data_offset + n_complex * complex_size].view(
+                np.complex128
+            )
+            raw_fields = np.lib.stride_tricks.as_strided(
+                cbuf,
+                shape=(data.ntime, data.nfield, nz, data.nky, nx),
+                strides=(
+                    kept_stride,
+                    2 * int_size + field_size,
+                    nx * data.nky * complex_size,
+                    nx * complex_size,
+                    complex_size,
+                ),
+            )
+            # Materialise in a single pass, conjugating to match pyro
+            # convention for ion/electron direction and writing straight into
+            # the output axis order so no further transpose copy is needed
+            if data.linear:
+                sliced_field = np.empty(
+                    (data.nfield, nx, data.nky, nz, data.ntime), dtype=complex
+                )
+                np.conjugate(raw_fields.transpose(1, 4, 3, 2, 0), out=sliced_field)
+            else:
+                fields = np.empty(
+                    (data.nfield, data.ntheta, data.nkx, data.nky, data.ntime),
+                    dtype=complex,
+                )
+                np.conjugate(raw_fields.transpose(1, 2, 4, 3, 0), out=fields)
 
         # Read .h5 file if binary file absent
         else:
+            if data.linear:
+                sliced_field = np.empty(
+                    (data.nfield, nx, data.nky, nz, data.ntime), dtype=complex
+                )
+            else:
+                fields = np.empty(
+                    (data.nfield, data.ntheta, data.nkx, data.nky, data.ntime),
+                    dtype=complex,
+                )
             h5_field_subgroup_names = ["phi", "A_par", "B_par"]
-            fields = np.empty(
-                (data.nfield, data.nkx, data.nky, data.ntheta, data.ntime),
-                dtype=complex,
-            )
-            with h5py.File(raw_data["field"], "r") as file:
+            # GENE writes one small dataset per timestep, so reads cross many
+            # chunks; the default 1 MB chunk cache thrashes badly on such
+            # files. Raise it well above the size of a single timestep
+            with h5py.File(
+                raw_data["field"],
+                "r",
+                rdcc_nbytes=64 * 1024 * 1024,
+                rdcc_nslots=1_000_003,
+            ) as file:
                 # Read in time data
                 time.extend(list(file.get("field/time")))
                 for i_field in range(data.nfield):
                     h5_subgroup = "field/" + h5_field_subgroup_names[i_field] + "/"
                     h5_dataset_names = list(file[h5_subgroup].keys())
+                    # Decode every timestep into one preallocated compound
+                    # array with read_direct, then convert real/imaginary to
+                    # complex in a single vectorised step
+                    first = file[h5_subgroup + h5_dataset_names[0]]
+                    raw_field = np.empty((data.ntime,) + first.shape, dtype=first.dtype)
                     for i_time in range(data.ntime):
-                        h5_dataset = h5_subgroup + h5_dataset_names[i_time]
-                        raw_field = np.array(file.get(h5_dataset))
-                        raw_field = np.array(
-                            raw_field["real"] + raw_field["imaginary"] * 1j,
-                            dtype="complex128",
+                        file[h5_subgroup + h5_dataset_names[i_time]].read_direct(
+                            raw_field[i_time]
                         )
-                        sliced_field[i_field, :, :, :, i_time] = np.swapaxes(
-                            raw_field, 0, 2
+                    # The compound {real, imaginary} pairs already have the
+                    # memory layout of complex128, so view them in place
+                    # rather than building real - 1j*imaginary from scratch
+                    if (
+                        raw_field.dtype.names == ("real", "imaginary")
+                        and raw_field.dtype.itemsize == complex_size
+                    ):
+                        complex_field = raw_field.view(np.complex128)
+                    else:
+                        complex_field = np.empty(
+                            raw_field.shape, dtype=np.complex128
+                        )
+                        complex_field.real = raw_field["real"]
+                        complex_field.imag = raw_field["imaginary"]
+                    # Conjugate to match pyro convention for ion/electron
+                    # direction; the transpose puts (time, nz, nky, nx) into
+                    # the destination's axis order
+                    if data.linear:
+                        # -> (nx, nky, nz, time)
+                        np.conjugate(
+                            complex_field.transpose(3, 2, 1, 0),
+                            out=sliced_field[i_field],
+                        )
+                    else:
+                        # -> (theta, kx, ky, time)
+                        np.conjugate(
+                            complex_field.transpose(1, 3, 2, 0),
+                            out=fields[i_field],
                         )
-
-        # Match pyro convention for ion/electron direction
-        sliced_field = np.conjugate(sliced_field)
-
-        if not data.linear:
-            nl_shape = (data.nfield, data.nkx, data.nky, data.ntheta, data.ntime)
-            fields = sliced_field.reshape(nl_shape, order="F")
 
         # Convert from kx to ballooning space
-        else:
+        if data.linear:
             try:
                 n0_global = gk_input.data["box"]["n0_global"]
                 q0 = gk_input.data["geometry"]["q0"]
                 phase_fac = -np.exp(-2 * np.pi * 1j * n0_global * q0)
             except KeyError:
                 phase_fac = -1
-            i_ball = 0
 
-            for i_conn in range(-int(nx / 2) + 1, int((nx - 1) / 2) + 1):
-                fields[:, 0, :, i_ball : i_ball + nz, :] = (
-                    sliced_field[:, i_conn, :, :, :] * (phase_fac) ** i_conn
+            # Gather all connections at once and apply the phase factors in a
+            # single broadcasted multiply, rather than copying one nz-wide
+            # slab per connection
+            i_conn = np.arange(-(nx // 2) + 1, (nx - 1) // 2 + 1)
+            phases = np.asarray(phase_fac, dtype=complex) ** i_conn
+
+            fields = np.empty(
+                (data.nfield, data.ntheta, data.nkx, data.nky, data.ntime),
+                dtype=complex,
+            )
+            # View the ballooning theta axis as (connection, nz) and multiply
+            # the phase factors straight into it. The connections are the x
+            # modes -(nx//2)+1..-1, 0..(nx-1)//2, which map onto two
+            # contiguous slices of the x axis, so no intermediate copy of the
+            # field data is needed
+            dest = fields[:, :, 0].reshape(
+                data.nfield, len(i_conn), nz, data.nky, data.ntime
+            )
+            src = sliced_field.transpose(0, 1, 3, 2, 4)
+            phase_col = phases[None, :, None, None, None]
+            n_neg = nx // 2 - 1
+            if n_neg:
+                np.multiply(
+                    src[:, nx - n_neg :], phase_col[:, :n_neg], out=dest[:, :n_neg]
                 )
-                i_ball += nz
+            np.multiply(
+                src[:, : nx - 1 - n_neg], phase_col[:, n_neg:], out=dest[:, n_neg:]
+            )
 
         # =================================================
 
         # Overwrite 'time' coordinate as determined in _init_dataset
         data["time"] = time
 
-        # Original method coords: (field, kx, ky, theta, time)
-        # New coords: (field, theta, kx, ky, time)
-        fields = fields.transpose(0, 3, 1, 2, 4)
-
         data["fields"] = (coords, fields)
 
         return data
@@ -355,15 +471,16 @@ class GKOutputReaderGENE(GKOutputReader):
 
         # ky data not available in the nrg file so no ky coords here
         coords = ("species", "moment", "field", "time")
-        fluxes = np.empty([data.dims[coord] for coord in coords])
+        fluxes = np.zeros([data.dims[coord] for coord in coords])
 
         if "nrg" not in raw_data:
             logging.warning("Flux data not found, setting all fluxes to zero")
-            fluxes[:, :, :, :] = 0
             data["fluxes"] = (coords, fluxes)
             return data
 
-        nml = f90nml.read(raw_data["parameters"])
+        # gk_input already parsed the parameters file; no need to run f90nml
+        # over it a second time
+        nml = gk_input.data
         flux_istep = nml["in_out"]["istep_nrg"]
         field_istep = nml["in_out"]["istep_field"]
 
@@ -378,44 +495,48 @@ class GKOutputReaderGENE(GKOutputReader):
         else:
             time_skip = downsize - 1
 
-        with open(raw_data["nrg"], "r") as csv_file:
-            nrg_data = csv.reader(csv_file, delimiter=" ", skipinitialspace=True)
-
-            if data.nfield == 3:
-                logging.warning(
-                    "GENE combines Apar and Bpar fluxes, setting Bpar fluxes to zero"
-                )
-                fluxes[:, :, 2, :] = 0.0
-                field_size = 2
-            else:
-                field_size = data.nfield
-
-            for i_time in range(data.ntime):
-                time = next(nrg_data)  # noqa
-
-                for i_species in range(data.nspecies):
-                    nrg_line = np.array(next(nrg_data), dtype=float)
-
-                    # Particle
-                    fluxes[i_species, 0, :field_size, i_time] = nrg_line[
-                        4 : 4 + field_size,
-                    ]
-
-                    # Energy
-                    fluxes[i_species, 1, :field_size, i_time] = nrg_line[
-                        6 : 6 + field_size,
-                    ]
-
-                    # Momentum
-                    fluxes[i_species, 2, :field_size, i_time] = nrg_line[
-                        8 : 8 + field_size,
-                    ]
+        if data.nfield == 3:
+            logging.warning(
+                "GENE combines Apar and Bpar fluxes, setting Bpar fluxes to zero"
+            )
+            field_size = 2
+        else:
+            field_size = data.nfield
 
-                # Skip time/data values in field print out is less
-                if i_time < data.ntime - 2:
-                    for skip_t in range(time_skip):
-                        for skip_s in range(data.nspecies + 1):
-                            next(nrg_data)
+        # Parse the whole file in one pass: each block is a time line
+        # followed by one line of ncols values per species, so the token
+        # stream reshapes cleanly into blocks
+        with open(raw_data["nrg"], "r") as f:
+            f.readline()
+            ncols = len(f.readline().split())
+            f.seek(0)
+            tokens = np.fromstring(f.read(), sep=" ")
+
+        block_size = 1 + data.nspecies * ncols
+        nblocks = tokens.size // block_size
+        nrg_data = tokens[: nblocks * block_size].reshape(nblocks, block_size)[
+            :, 1:
+        ].reshape(nblocks, data.nspecies, ncols)
+
+        # Blocks kept after accounting for the field/flux output cadence; the
+        # final time is written on the step after the second-to-last one
+        kept = np.arange(data.ntime) * (time_skip + 1)
+        if data.ntime >= 2:
+            kept[-1] = kept[-2] + 1
+        nrg_data = nrg_data[kept]
+
+        # Particle
+        fluxes[:, 0, :field_size, :] = nrg_data[..., 4 : 4 + field_size].transpose(
+            1, 2, 0
+        )
+        # Energy
+        fluxes[:, 1, :field_size, :] = nrg_data[..., 6 : 6 + field_size].transpose(
+            1, 2, 0
+        )
+        # Momentum
+        fluxes[:, 2, :field_size, :] = nrg_data[..., 8 : 8 + field_size].transpose(
+            1, 2, 0
+        )
 
         data["fluxes"] = (coords, fluxes)
         return data
@@ -431,17 +552,10 @@ class GKOutputReaderGENE(GKOutputReader):
             "'fields' not set in data, falling back to reading 'omega' -- 'eigenvalues' will not be set!"
         )
 
-        kys = []
-        frequencies = []
-        growth_rates = []
-
-        with open(raw_data["omega"], "r") as csv_file:
-            omega_data = csv.reader(csv_file, delimiter=" ", skipinitialspace=True)
-            for line in omega_data:
-                ky, growth_rate, frequency = line
-                kys.append(float(ky))
-                frequencies.append(float(frequency))
-                growth_rates.append(float(growth_rate))
+        omega_data = np.loadtxt(raw_data["omega"], ndmin=2)
+        kys = omega_data[:, 0]
+        growth_rates = omega_data[:, 1]
+        frequencies = omega_data[:, 2]
 
         last_timestep = [data.time.isel(time=-1)]
         coords = {"time": last_timestep, "ky": kys, "kx": [0.0]}
@@ -1,19 +1,49 @@
 from .GKInput import GKInput, gk_inputs
 from .GKOutputReader import GKOutputReader, gk_output_readers, get_growth_rate_tolerance
-from .GKInputGS2 import GKInputGS2
-from .GKInputCGYRO import GKInputCGYRO
-from .GKInputGENE import GKInputGENE
-from .GKInputTGLF import GKInputTGLF
-from .GKOutputReaderGS2 import GKOutputReaderGS2
-from .GKOutputReaderCGYRO import GKOutputReaderCGYRO
-from .GKOutputReaderGENE import GKOutputReaderGENE
-from .GKOutputReaderTGLF import GKOutputReaderTGLF
 
-gk_inputs["GS2"] = GKInputGS2
-gk_inputs["CGYRO"] = GKInputCGYRO
-gk_inputs["GENE"] = GKInputGENE
-gk_inputs["TGLF"] = GKInputTGLF
-gk_output_readers["GS2"] = GKOutputReaderGS2
-gk_output_readers["CGYRO"] = GKOutputReaderCGYRO
-gk_output_readers["GENE"] = GKOutputReaderGENE
-gk_output_readers["TGLF"] = GKOutputReaderTGLF
+# Register each code by import path rather than importing it here, so the
+# defining module (and its dependencies) is only imported when that code is
+# first used.
+gk_inputs.register_lazy("GS2", "pyrokinetics.gk_code.GKInputGS2", "GKInputGS2")
+gk_inputs.register_lazy("CGYRO", "pyrokinetics.gk_code.GKInputCGYRO", "GKInputCGYRO")
+gk_inputs.register_lazy("GENE", "pyrokinetics.gk_code.GKInputGENE", "GKInputGENE")
+gk_inputs.register_lazy("TGLF", "pyrokinetics.gk_code.GKInputTGLF", "GKInputTGLF")
+gk_output_readers.register_lazy(
+    "GS2", "pyrokinetics.gk_code.GKOutputReaderGS2", "GKOutputReaderGS2"
+)
+gk_output_readers.register_lazy(
+    "CGYRO", "pyrokinetics.gk_code.GKOutputReaderCGYRO", "GKOutputReaderCGYRO"
+)
+gk_output_readers.register_lazy(
+    "GENE", "pyrokinetics.gk_code.GKOutputReaderGENE", "GKOutputReaderGENE"
+)
+gk_output_readers.register_lazy(
+    "TGLF", "pyrokinetics.gk_code.GKOutputReaderTGLF", "GKOutputReaderTGLF"
+)
+
+# Maintain `from pyrokinetics.gk_code import GKInputGS2` style imports without
+# eagerly importing every submodule (PEP 562)
+_class_modules = {
+    "GKInputGS2": ".GKInputGS2",
+    "GKInputCGYRO": ".GKInputCGYRO",
+    "GKInputGENE": ".GKInputGENE",
+    "GKInputTGLF": ".GKInputTGLF",
+    "GKOutputReaderGS2": ".GKOutputReaderGS2",
+    "GKOutputReaderCGYRO": ".GKOutputReaderCGYRO",
+    "GKOutputReaderGENE": ".GKOutputReaderGENE",
+    "GKOutputReaderTGLF": ".GKOutputReaderTGLF",
+}
+
+
+def __getattr__(name):
+    try:
+        module = _class_modules[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    cls = getattr(import_module(module, __name__), name)
+    # Re-bind the class over the submodule attribute set by the import
+    # machinery (they share a name), so later lookups get the class directly
+    globals()[name] = cls
+    return cls
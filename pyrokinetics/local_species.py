@@ -1,4 +1,5 @@
 import warnings
+from contextlib import contextmanager
 
 from cleverdict import CleverDict
 from .constants import pi
@@ -8,6 +9,22 @@ import numpy as np
 from typing import Dict, Optional
 
 
+def _magnitudes(values):
+    """
+    Magnitudes of ``values`` in the units of the first entry, along with
+    those units (``None`` if the first entry carries no units). Used to do
+    species reductions in NumPy rather than species-by-species pint
+    arithmetic, which performs dimensional analysis on every operation.
+    """
+    units = getattr(values[0], "units", None)
+    if units is None:
+        return np.asarray(values, dtype=float), None
+    return (
+        np.array([v.m if v.units == units else v.m_as(units) for v in values]),
+        units,
+    )
+
+
 class LocalSpecies(CleverDict):
     r"""
     Dictionary of local species parameters where the
@@ -83,6 +100,7 @@ class LocalSpecies(CleverDict):
         # FIXME: What are these units?
         coolog = 24 - np.log(np.sqrt(ne.m * 1e-6) / Te.m)
 
+        pending = []
         for species in kinetics.species_names:
             species_dict = CleverDict()
 
@@ -115,18 +133,22 @@ class LocalSpecies(CleverDict):
             species_dict["name"] = species
             species_dict["mass"] = mass.to(norm.mref)
             species_dict["z"] = z.to(norm.qref)
-            species_dict["dens"] = dens.to(norm.nref)
-            species_dict["temp"] = temp.to(norm.tref)
             species_dict["vel"] = vel.to(norm.vref)
             species_dict["nu"] = nu
 
-            # Gradients
-            species_dict["a_lt"] = a_lt
-            species_dict["a_ln"] = a_ln
+            # Write dens/temp and the gradients through their shadow fields:
+            # the property setters only exist to trigger update_pressure,
+            # which is redundant while the species are being assembled
+            species_dict["_dens"] = dens.to(norm.nref)
+            species_dict["_temp"] = temp.to(norm.tref)
+            species_dict["_a_lt"] = a_lt
+            species_dict["_a_ln"] = a_ln
             species_dict["a_lv"] = a_lv
 
             # Add to LocalSpecies dict
-            self.add_species(name=species, species_data=species_dict, norms=norm)
+            pending.append((species, species_dict))
+
+        self.add_species_bulk(pending, norms=norm)
 
         self.set_zeff()
         self.check_quasineutrality(tol=1e-3)
@@ -140,13 +162,15 @@ class LocalSpecies(CleverDict):
         self['zeff']
         """
 
-        zeff = 0.0
+        ions = [self[name] for name in self.names if name != "electron"]
 
-        for name in self.names:
-            if name == "electron":
-                continue
-            species = self[name]
-            zeff += species["dens"] * species["z"] ** 2
+        zeff = 0.0
+        if ions:
+            dens, dens_units = _magnitudes([species["dens"] for species in ions])
+            z, z_units = _magnitudes([species["z"] for species in ions])
+            zeff = np.dot(dens, z**2)
+            if dens_units is not None:
+                zeff = zeff * dens_units * z_units**2
 
         self.zeff = zeff / (-self["electron"]["dens"] * self["electron"]["z"])
 
@@ -155,11 +179,13 @@ class LocalSpecies(CleverDict):
         Checks quasi-neutrality is satisfied and raises a warning if it is not
 
         """
-        error = 0.0
+        all_species = [self[name] for name in self.names]
+        dens, dens_units = _magnitudes([species["dens"] for species in all_species])
+        z, z_units = _magnitudes([species["z"] for species in all_species])
 
-        for name in self.names:
-            species = self[name]
-            error += species["dens"] * species["z"]
+        error = np.dot(dens, z)
+        if dens_units is not None:
+            error = error * dens_units * z_units
 
         error = error / (self["electron"]["dens"] * self["electron"]["z"])
 
@@ -168,6 +194,20 @@ class LocalSpecies(CleverDict):
                 f"Currently local species violates quasi-neutrality by {error.magnitude}"
             )
 
+    @contextmanager
+    def batch_updates(self):
+        """
+        Context manager suspending the pressure recalculation fired by each
+        dens/temp/gradient assignment, then recalculating once on exit.
+        Without this, loading N species costs O(N^2) pint arithmetic.
+        """
+        self.setattr_direct("_updates_suspended", True)
+        try:
+            yield self
+        finally:
+            self.setattr_direct("_updates_suspended", False)
+            self.update_pressure()
+
     def update_pressure(self):
         """
         Calculate a_lp and pressure for species
@@ -178,23 +218,33 @@ class LocalSpecies(CleverDict):
         self['pressure']
         """
 
-        pressure = 0.0
-        a_lp = 0.0
-        for name in self.names:
-            species = self[name]
-            # Total pressure
-            pressure += species["temp"] * species["dens"]
-            a_lp += (
-                species["temp"] * species["dens"] * (species["a_lt"] + species["a_ln"])
-            )
+        if getattr(self, "_updates_suspended", False):
+            return
+
+        if not self.names:
+            self["pressure"] = 0.0
+            self["a_lp"] = 0.0
+            return
+
+        all_species = [self[name] for name in self.names]
+        temp, temp_units = _magnitudes([species["temp"] for species in all_species])
+        dens, dens_units = _magnitudes([species["dens"] for species in all_species])
+        grad, _ = _magnitudes(
+            [species["a_lt"] + species["a_ln"] for species in all_species]
+        )
+
+        # Total pressure
+        partial_pressures = temp * dens
+        pressure = partial_pressures.sum()
+        if temp_units is not None:
+            pressure = pressure * temp_units
+        if dens_units is not None:
+            pressure = pressure * dens_units
 
         self["pressure"] = pressure
 
-        if hasattr(a_lp, "magnitude"):
-            # Cancel out units from pressure
-            a_lp = a_lp.magnitude
-
-        self["a_lp"] = a_lp
+        # Units cancel out with pressure
+        self["a_lp"] = float(np.dot(partial_pressures, grad))
 
     def normalise(self):
         # Normalise to pyrokinetics normalisations and calculate total pressure gradient
@@ -226,6 +276,28 @@ class LocalSpecies(CleverDict):
         self.names.append(name)
         self.update_pressure()
 
+    def add_species_bulk(self, species, norms: Optional[Normalisation] = None):
+        """
+        Adds several species to LocalSpecies at once, recalculating the
+        pressure once at the end rather than after each species
+
+        Parameters
+        ----------
+        species : Iterable of (name, species_data) pairs
+        norms : Normalisation to apply to each species
+
+        Returns
+        -------
+        self[name] = SingleLocalSpecies for each pair
+        """
+
+        with self.batch_updates():
+            added = []
+            for name, species_data in species:
+                self[name] = self.SingleLocalSpecies(self, species_data, norms)
+                added.append(name)
+            self.names.extend(added)
+
     @property
     def nspec(self):
         return len(self.names)
@@ -248,25 +320,28 @@ class LocalSpecies(CleverDict):
                 setattr(new_local_species, key, value)
 
         # Add in each species
-        for name in self["names"]:
-            dict_keys = {
-                "name": "name",
-                "mass": "mass",
-                "z": "z",
-                "nu": "nu",
-                "vel": "vel",
-                "a_lv": "a_lv",
-                "_dens": "dens",
-                "_temp": "temp",
-                "_a_ln": "a_ln",
-                "_a_lt": "a_lt",
-            }
-            species_data = dict(
-                (new_key, self[name][old_key])
-                for (new_key, old_key) in dict_keys.items()
+        dict_keys = {
+            "name": "name",
+            "mass": "mass",
+            "z": "z",
+            "nu": "nu",
+            "vel": "vel",
+            "a_lv": "a_lv",
+            "_dens": "dens",
+            "_temp": "temp",
+            "_a_ln": "a_ln",
+            "_a_lt": "a_lt",
+        }
+        new_local_species.add_species_bulk(
+            (
+                name,
+                {
+                    new_key: self[name][old_key]
+                    for (new_key, old_key) in dict_keys.items()
+                },
             )
-
-            new_local_species.add_species(name, species_data)
+            for name in self["names"]
+        )
 
         return new_local_species
 
@@ -294,6 +369,24 @@ class LocalSpecies(CleverDict):
 
         """
 
+        # Fixed attribute layout: these objects are accessed heavily in the
+        # per-species loops of the GK input readers/writers, and slot access
+        # avoids a per-instance dict lookup
+        __slots__ = (
+            "localspecies",
+            "norms",
+            "name",
+            "mass",
+            "z",
+            "vel",
+            "nu",
+            "a_lv",
+            "_dens",
+            "_temp",
+            "_a_lt",
+            "_a_ln",
+        )
+
         def __init__(
             self,
             localspecies,
@@ -2,19 +2,26 @@ import uuid
 from datetime import datetime
 from typing import Dict
 
+# Prefer the version file written by setuptools_scm at build time: reading it
+# is a plain import, whereas importlib.metadata scans the metadata of every
+# installed distribution. Fall back to the slower lookups for source trees
+# that have never been built.
 try:
-    from importlib.metadata import version, PackageNotFoundError
-except ModuleNotFoundError:
-    from importlib_metadata import version, PackageNotFoundError
-try:
-    __version__ = version("pyrokinetics")
-except PackageNotFoundError:
+    from ._version import __version__
+except ImportError:
     try:
-        from setuptools_scm import get_version
-
-        __version__ = get_version(root="..", relative_to=__file__)
-    except ImportError:
-        __version__ = "0.0.1"
+        from importlib.metadata import version, PackageNotFoundError
+    except ModuleNotFoundError:
+        from importlib_metadata import version, PackageNotFoundError
+    try:
+        __version__ = version("pyrokinetics")
+    except PackageNotFoundError:
+        try:
+            from setuptools_scm import get_version
+
+            __version__ = get_version(root="..", relative_to=__file__)
+        except ImportError:
+            __version__ = "0.0.1"
 
 
 # Define UUID and session start as module-level variables.
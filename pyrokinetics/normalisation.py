@@ -641,14 +641,21 @@ class ConventionNormalisation(Normalisation):
         self._update_system()
 
 
-def convert_dict(data: Dict, norm: ConventionNormalisation) -> Dict:
-    """Copy data into a new dict, converting any quantities to other normalisation"""
+def convert_dict(
+    data: Dict, norm: ConventionNormalisation, in_place: bool = False
+) -> Dict:
+    """Copy data into a new dict, converting any quantities to other normalisation.
 
-    new_data = {}
+    If ``in_place`` is True, convert quantities directly in ``data`` instead,
+    leaving non-quantity entries untouched and avoiding the copy.
+    """
+
+    quantity = norm._registry.Quantity
+    new_data = data if in_place else dict(data)
     for key, value in data.items():
-        if isinstance(value, norm._registry.Quantity):
+        if isinstance(value, quantity):
             try:
-                value = value.to(norm).magnitude
+                new_data[key] = value.to(norm).magnitude
             except (PyroNormalisationError, pint.DimensionalityError) as err:
                 raise ValueError(
                     f"Couldn't convert '{key}' ({value}) to {norm.name} normalisation. "
@@ -657,6 +664,4 @@ def convert_dict(data: Dict, norm: ConventionNormalisation) -> Dict:
                     "`Pyro` object."
                 ) from err
 
-        new_data[key] = value
-
     return new_data
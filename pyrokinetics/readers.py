@@ -87,9 +87,11 @@ def create_reader_factory(BaseReader=Reader, name: str = None):
             filename = Path(filename)
             if not filename.exists():
                 raise FileNotFoundError(f"{filename} does not exist")
-            for file_type, Reader in self.data.items():
+            # Iterate over keys rather than self.data so that any readers
+            # registered lazily are materialised before being tried.
+            for file_type in list(self):
                 try:
-                    Reader().verify(filename)
+                    self.get_type(file_type)().verify(filename)
                     return file_type
                 except Exception:
                     continue